@@ -3,12 +3,8 @@ Cor - Advanced Gaze Detection Library
 Pure Python implementation for gaze detection and eye tracking
 """
 
-import sys
 import os
-import csv
-from datetime import datetime
-import glob
-from pathlib import Path
+import warnings
 
 __version__ = '1.0.5.1'
 
@@ -87,8 +83,14 @@ def get_paths():
     """Get current path configuration"""
     return _custom_paths.copy()
 
-def run(video_file, *args):
+def run(video_file, *args, visualize=False):
     """Basic gaze detection using Python and OpenCV"""
+    # Legacy string flag is still accepted, but steers callers to the keyword
+    if "--visualize" in args:
+        warnings.warn('cor.run(video_file, "--visualize") is deprecated, use visualize=True',
+                      DeprecationWarning, stacklevel=2)
+        visualize = True
+    
     try:
         import cv2
         import numpy as np
@@ -96,9 +98,6 @@ def run(video_file, *args):
         
         print(f"Processing {video_file} in Python mode...")
         
-        # Check if --visualize flag is present
-        visualize = "--visualize" in args
-        
         # Basic video processing
         cap = cv2.VideoCapture(video_file)
         if not cap.isOpened():
@@ -114,9 +113,10 @@ def run(video_file, *args):
         # Simple processing - just create basic output files
         video_name = os.path.splitext(os.path.basename(video_file))[0]
         
-        # Create simple heatmap placeholder
+        # Create simple heatmap placeholder (uint8, the colormap quantizes to 8 bits anyway)
+        heatmap_data = np.random.randint(0, 256, size=(height, width), dtype=np.uint8)
         fig, ax = plt.subplots(figsize=(width/100, height/100), dpi=100)
-        ax.imshow(np.random.rand(height, width), cmap='hot', alpha=0.6)
+        ax.imshow(heatmap_data, cmap='hot', alpha=0.6)
         ax.set_xlim(0, width)
         ax.set_ylim(height, 0)
         ax.axis('off')
@@ -210,11 +210,7 @@ def cli():
 
     
     # Run gaze detection
-    run_args = []
-    if args.visualize:
-        run_args.append("--visualize")
-    
-    result = run(args.video_file, *run_args)
+    result = run(args.video_file, visualize=args.visualize)
     if result:
         print("Processing completed successfully")
     else:
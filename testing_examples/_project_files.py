@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Shared file helpers for the Cor project check scripts
+Directory listings and file contents are cached for the length of one run
+"""
+
+import os
+import re
+import functools
+from pathlib import Path
+
+@functools.lru_cache(maxsize=None)
+def list_dir(directory):
+    """Scan a directory once per run, mapping names to entries (empty if missing)"""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name: entry for entry in entries}
+    except OSError:
+        return {}
+
+def file_present(file_path):
+    """Check for a regular file against its directory's cached listing"""
+    directory, name = os.path.split(file_path)
+    entry = list_dir(directory or ".").get(name)
+    # is_file() answers from the directory read, no extra stat
+    return entry is not None and entry.is_file()
+
+@functools.lru_cache(maxsize=None)
+def read_bytes(file_path):
+    """Read a file's raw bytes once per run"""
+    return Path(file_path).read_bytes()
+
+def find_needles(needles, content):
+    """Return the (str) needles found in str or bytes content using one combined regex scan"""
+    if isinstance(content, bytes):
+        keys = {needle.encode(): needle for needle in needles}
+        pattern = re.compile(b"(?=(" + b"|".join(map(re.escape, keys)) + b"))")
+    else:
+        keys = {needle: needle for needle in needles}
+        pattern = re.compile("(?=(" + "|".join(map(re.escape, keys)) + "))")
+    # The zero-width lookahead advances one character at a time, so a needle
+    # starting inside another match (highgui in its #include) is still found
+    found = set()
+    for match in pattern.finditer(content):
+        found.add(match.group(1))
+        # Stop as soon as every needle has turned up, no need to scan the rest
+        if len(found) == len(keys):
+            break
+    # Only one alternative is captured per offset, so a needle sharing its start
+    # with another ('cor.run' and 'cor.run(') can be missed; confirm misses directly
+    found.update(key for key in keys if key not in found and key in content)
+    return {keys[key] for key in found}
@@ -9,13 +9,12 @@ import sys
 import subprocess
 import shutil
 import tempfile
-from pathlib import Path
 
 def run_command(cmd, description="", check=True):
-    """Run a command and handle errors"""
-    print(f"Running: {description or cmd}")
+    """Run a command (argument list, no shell) and handle errors"""
+    print(f"Running: {description or ' '.join(cmd)}")
     try:
-        result = subprocess.run(cmd, shell=True, check=check, 
+        result = subprocess.run(cmd, check=check,
                               capture_output=True, text=True)
         if result.stdout:
             print(result.stdout)
@@ -30,11 +29,13 @@ def check_dependencies():
     """Check if required dependencies are available"""
     print("Checking dependencies...")
     
+    # Probe the interpreter running this script; OpenCV and NumPy share one
+    # interpreter start-up instead of one each
     dependencies = {
-        'python': 'python --version',
-        'pip': 'pip --version',
-        'opencv': 'python -c "import cv2; print(f\'OpenCV {cv2.__version__}\')"',
-        'numpy': 'python -c "import numpy; print(f\'NumPy {numpy.__version__}\')"',
+        'python': [sys.executable, '--version'],
+        'pip': [sys.executable, '-m', 'pip', '--version'],
+        'opencv, numpy': [sys.executable, '-c',
+                          "import cv2, numpy; print(f'OpenCV {cv2.__version__}, NumPy {numpy.__version__}')"],
     }
     
     missing = []
@@ -54,19 +55,29 @@ def clean_build():
     """Clean previous build artifacts"""
     print("Cleaning previous build artifacts...")
     
-    dirs_to_clean = ['build', 'dist', '*.egg-info', '__pycache__']
-    files_to_clean = ['*.so', '*.pyd', '*.pyc']
-    
-    for pattern in dirs_to_clean:
-        for path in Path('.').glob(pattern):
-            if path.is_dir():
+    top_level_dirs = ('build', 'dist')
+    file_suffixes = ('.so', '.pyd', '.pyc')
+    skip_dirs = {'.git', 'node_modules', '.venv', 'venv', '.tox'}
+    
+    # One pruned walk: removed directories and version control, dependency
+    # and virtualenv trees (whose compiled extensions must survive) are
+    # dropped from `dirs` so the walk never descends into them
+    for root, dirs, files in os.walk('.', topdown=True):
+        kept_dirs = []
+        for name in dirs:
+            path = os.path.normpath(os.path.join(root, name))
+            at_top = root == '.'
+            if name == '__pycache__' or (at_top and (name in top_level_dirs or name.endswith('.egg-info'))):
                 shutil.rmtree(path, ignore_errors=True)
                 print(f"Removed directory: {path}")
-    
-    for pattern in files_to_clean:
-        for path in Path('.').rglob(pattern):
-            if path.is_file():
-                path.unlink()
+            elif name not in skip_dirs:
+                kept_dirs.append(name)
+        dirs[:] = kept_dirs
+        
+        for name in files:
+            if name.endswith(file_suffixes):
+                path = os.path.normpath(os.path.join(root, name))
+                os.unlink(path)
                 print(f"Removed file: {path}")
 
 def install_package():
@@ -75,17 +86,16 @@ def install_package():
     
     # Try different installation approaches
     install_commands = [
-        "pip install -e .",
-        "python -m pip install -e .",
-        "python setup.py install"
+        [sys.executable, "-m", "pip", "install", "-e", "."],
+        [sys.executable, "setup.py", "install"]
     ]
     
     for cmd in install_commands:
-        print(f"Trying: {cmd}")
+        print(f"Trying: {' '.join(cmd)}")
         if run_command(cmd, check=False):
             print("✓ Build successful")
             return True
-        print(f"Build command failed: {cmd}")
+        print(f"Build command failed: {' '.join(cmd)}")
     
     print("✗ All build attempts failed")
     return False
@@ -98,7 +108,7 @@ def run_tests():
         print("✗ Test file not found")
         return False
     
-    return run_command("python test_cor.py", "Running tests")
+    return run_command([sys.executable, "test_cor.py"], "Running tests")
 
 def create_example_usage():
     """Create example usage script"""
@@ -134,7 +144,7 @@ def main():
     print("   - Create a video file (MP4, AVI, MOV, etc.)")
     print("   - Run: cor.calibrate_eyes('your_video.mp4')")
     print("   - Run: cor.calibrate_gaze('your_video.mp4')")
-    print("   - Run: cor.run('your_video.mp4', '--visualize')")
+    print("   - Run: cor.run('your_video.mp4', visualize=True)")
     
     print("\\nExample completed successfully!")
 
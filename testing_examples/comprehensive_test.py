@@ -7,76 +7,245 @@ Tests all aspects of the codebase without requiring compilation
 import os
 import sys
 import re
+import json
+import hashlib
+import functools
+import itertools
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
-def test_c_syntax():
-    """Test C code for syntax issues"""
-    print("Testing C code syntax...")
+# All source regexes work on raw bytes; only the matched pieces are ever decoded
+
+# Bare call on a line of its own, matched across the whole file at once
+_SEMI_RE = re.compile(rb'^[^\S\n]*[a-zA-Z_][a-zA-Z0-9_]*[^\S\n]*\([^)\n]*\)[^\S\n]*$', re.MULTILINE)
+
+# C++-only constructs and crowded braces. Each token is matched on its own (a brace only
+# looks ahead for a second one on the same line), so several hits on a line all count
+_C_ONLY_RE = re.compile(rb'(?P<cpp>std::)|(?P<namespace>namespace)|(?P<braces>\{(?=[^\n{]*\{)|\}(?=[^\n}]*\}))')
+
+# Issues are kept as (path, line, kind, text) and only formatted when printed
+_SYNTAX_MESSAGES = {
+    'semi': "Possible missing semicolon",
+    'cpp': "C++ syntax in C file",
+    'namespace': "C++ namespace in C file",
+    'braces': "Multiple braces on one line",
+}
+
+# Stop collecting syntax issues past this many; only the first few are printed anyway
+MAX_ISSUES = 200
+
+# Python API functions: declared in the header, defined in the module source
+_PY_DECL_RE = re.compile(rb'PyObject\*\s+(\w+)\s*\([^)]*\)\s*;')
+_PY_IMPL_RE = re.compile(rb'PyObject\*\s+(\w+)\s*\([^)]*\)\s*{')
+
+# cor.* calls in the docs, and entries of the module's method table
+_DOC_FUNC_RE = re.compile(rb'cor\.(\w+)\(')
+_METHOD_RE = re.compile(rb'\{"(\w+)",\s*cor_\w+,')
+
+# Parameters each configuration file must mention
+_CONFIG_PARAMS = {
+    'eye-detection-values.txt': [
+        'eye_cascade_scale_factor',
+        'pupil_detection_threshold',
+        'left_eye_offset_x',
+        'calibration_video_file'
+    ],
+    'gaze-direction-values.txt': [
+        'gaze_sensitivity_x',
+        'gaze_smoothing_factor',
+        'min_confidence_threshold',
+        'calibration_video_file'
+    ],
+    'cor.txt': [
+        'heatmap_color_scheme',
+        'frame_skip_factor',
+        'gaze_circle_radius',
+        'debug_mode'
+    ]
+}
+
+# One alternation per file, longest names first so a full name wins over a prefix
+_CONFIG_PARAM_RES = {
+    config_file: re.compile('|'.join(re.escape(param) for param in sorted(params, key=len, reverse=True)))
+    for config_file, params in _CONFIG_PARAMS.items()
+}
+
+# Gate for the OpenCV include checks, matched case-insensitively without lowering the file
+_OPENCV_RE = re.compile(rb'opencv', re.IGNORECASE)
+
+# Per-file syntax results from earlier runs; bump the version whenever the rules change
+_CACHE_DIR = Path('.cor_testcache')
+_CACHE_VERSION = '3'
+
+@functools.lru_cache(maxsize=None)
+def _exists(path):
+    """os.path.exists, remembered for the run; the tests never create the files they check"""
+    return os.path.exists(path)
+
+def _list_sources():
+    """C sources, then C++ sources, then headers, with one scandir per directory"""
+    found = {'.c': [], '.cpp': [], '.h': []}
+    for directory, suffixes in (('src', ('.c', '.cpp')), ('include', ('.h',))):
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    suffix = os.path.splitext(entry.name)[1]
+                    if suffix in suffixes and entry.is_file():
+                        found[suffix].append(Path(entry.path))
+        except FileNotFoundError:
+            continue
+    return found['.c'] + found['.cpp'] + found['.h']
+
+def _load_sources():
+    """Read every C/C++ source and header once, as {path: bytes}"""
+    return {path: path.read_bytes() for path in _list_sources()}
+
+def _source_bytes(sources, path):
+    """Contents of a source file, read from disk if it was not preloaded"""
+    buf = sources.get(Path(path))
+    if buf is None:
+        buf = Path(path).read_bytes()
+    return buf
+
+def _count_lines(buf):
+    """Count lines the way readlines() would, without splitting"""
+    return buf.count(b'\n') + (1 if buf and not buf.endswith(b'\n') else 0)
+
+def _newline_offsets(buf):
+    """Sorted offsets of every newline; bisecting it maps a match position to its line"""
+    return [m.start() for m in re.finditer(b'\n', buf)]
+
+def _scan_c_file(c_file, buf):
+    """Syntax issues for a single source file, at most MAX_ISSUES + 1 of them"""
+    # Line table, built on the first hit so clean files never pay for it
+    newlines = None
+    found = {}
+    
+    # Both passes run in line order, so capping each one (at a line boundary)
+    # still keeps the first issues of the file once they are merged
+    
+    # Check for missing semicolons (basic check)
+    for match in _SEMI_RE.finditer(buf):
+        if len(found) > MAX_ISSUES:
+            break
+        line = match.group()
+        if b'typedef' not in line and b'extern' not in line and b'#' not in line:
+            if newlines is None:
+                newlines = _newline_offsets(buf)
+            found[(bisect_right(newlines, match.start()), 0)] = 'semi'
+    
+    # Check for C++ syntax and unmatched braces (basic check) - only for .c files
+    if c_file.suffix == '.c':
+        semi_count = len(found)
+        last_line = None
+        for match in _C_ONLY_RE.finditer(buf):
+            if newlines is None:
+                newlines = _newline_offsets(buf)
+            line_index = bisect_right(newlines, match.start())
+            if line_index != last_line and len(found) - semi_count > MAX_ISSUES:
+                break
+            last_line = line_index
+            rank = ('cpp', 'namespace', 'braces').index(match.lastgroup) + 1
+            found[(line_index, rank)] = match.lastgroup
     
-    c_files = list(Path('src').glob('*.c')) + list(Path('src').glob('*.cpp')) + list(Path('include').glob('*.h'))
     issues = []
+    for line_index, rank in sorted(found)[:MAX_ISSUES + 1]:
+        start = newlines[line_index - 1] + 1 if line_index else 0
+        end = newlines[line_index] if line_index < len(newlines) else len(buf)
+        line = buf[start:end].strip().decode('utf-8', 'replace')
+        issues.append((str(c_file), line_index + 1, found[(line_index, rank)], line))
+    return issues
+
+def _cache_key(c_file, buf):
+    """Cache key covering the rules version, the file path and its contents"""
+    digest = hashlib.sha256(f"{_CACHE_VERSION}\0{c_file}\0".encode('utf-8'))
+    digest.update(buf)
+    return digest.hexdigest()
+
+def _cached_issues(key):
+    """Issues stored by a previous run, or None on a cache miss"""
+    try:
+        return json.loads((_CACHE_DIR / f"{key}.json").read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return None
+
+def _store_issues(key, issues):
+    """Save a file's issues for the next run (best effort)"""
+    try:
+        _CACHE_DIR.mkdir(exist_ok=True)
+        (_CACHE_DIR / f"{key}.json").write_text(json.dumps(issues), encoding='utf-8')
+    except OSError:
+        pass
+
+def test_c_syntax(sources=None):
+    """Test C code for syntax issues"""
+    print("Testing C code syntax...")
     
-    for c_file in c_files:
-        with open(c_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-            lines = content.split('\n')
-        
-        # Check for common C syntax issues
-        for i, line in enumerate(lines, 1):
-            # Check for missing semicolons (basic check)
-            if re.search(r'^\s*[a-zA-Z_][a-zA-Z0-9_]*\s*\([^)]*\)\s*$', line.strip()):
-                if not line.strip().endswith(';') and not line.strip().endswith('{'):
-                    if 'typedef' not in line and 'extern' not in line and '#' not in line:
-                        issues.append(f"{c_file}:{i}: Possible missing semicolon: {line.strip()}")
-            
-            # Check for C++ syntax in C files (but allow in .cpp files)
-            if c_file.suffix == '.c':
-                if 'std::' in line:
-                    issues.append(f"{c_file}:{i}: C++ syntax in C file: {line.strip()}")
-                if 'namespace' in line:
-                    issues.append(f"{c_file}:{i}: C++ namespace in C file: {line.strip()}")
-                
-                # Check for unmatched braces (basic check) - only for .c files
-                open_braces = line.count('{')
-                close_braces = line.count('}')
-                if open_braces > 1 or close_braces > 1:
-                    issues.append(f"{c_file}:{i}: Multiple braces on one line: {line.strip()}")
+    if sources is None:
+        sources = _load_sources()
+    
+    # Files unchanged since the last run reuse their cached results
+    results = {}
+    pending = []
+    for c_file, buf in sources.items():
+        key = _cache_key(c_file, buf)
+        cached = _cached_issues(key)
+        if cached is None:
+            pending.append((c_file, key))
+        else:
+            results[c_file] = cached
+    
+    # Regex scanning is CPU-bound, so spread the files over processes
+    if pending:
+        with ProcessPoolExecutor() as executor:
+            scanned = executor.map(_scan_c_file, [c_file for c_file, _ in pending],
+                                   [sources[c_file] for c_file, _ in pending], chunksize=8)
+            for (c_file, key), file_issues in zip(pending, scanned):
+                _store_issues(key, file_issues)
+                results[c_file] = file_issues
+    
+    if sources:
+        print(f"  {len(pending)} file(s) scanned, {len(sources) - len(pending)} reused from cache")
+    issues = list(itertools.islice(itertools.chain.from_iterable(
+        results[c_file] for c_file in sources), MAX_ISSUES + 1))
+    truncated = len(issues) > MAX_ISSUES
+    del issues[MAX_ISSUES:]
     
     if issues:
         print("⚠️  C syntax issues found:")
-        for issue in issues[:10]:  # Show first 10 issues
-            print(f"  {issue}")
-        if len(issues) > 10:
+        for path, line_no, kind, line in issues[:10]:  # Show first 10 issues
+            print(f"  {path}:{line_no}: {_SYNTAX_MESSAGES[kind]}: {line}")
+        if truncated:
+            print(f"  ... and more than {MAX_ISSUES - 10} more issues (stopped counting at {MAX_ISSUES})")
+        elif len(issues) > 10:
             print(f"  ... and {len(issues) - 10} more issues")
         return False
     else:
         print("✓ C syntax looks good")
         return True
 
-def test_function_declarations():
+def test_function_declarations(sources=None):
     """Test that all functions are properly declared"""
     print("\nTesting function declarations...")
     
+    if sources is None:
+        sources = _load_sources()
+    
     # Read header file
-    with open('include/cor.h', 'r', encoding='utf-8') as f:
-        header_content = f.read()
+    header_content = _source_bytes(sources, 'include/cor.h')
     
     # Extract Python function declarations (PyObject* functions)
-    python_declarations = re.findall(r'PyObject\*\s+(\w+)\s*\([^)]*\)\s*;', header_content)
-    declared_python_functions = set(python_declarations)
+    declared_python_functions = {m.group(1).decode('ascii') for m in _PY_DECL_RE.finditer(header_content)}
     
     # Check Python module functions
-    module_file = 'src/cor_module.cpp' if os.path.exists('src/cor_module.cpp') else 'src/cor_module.c'
-    with open(module_file, 'r', encoding='utf-8') as f:
-        module_content = f.read()
+    module_file = 'src/cor_module.cpp' if _exists('src/cor_module.cpp') else 'src/cor_module.c'
+    module_content = _source_bytes(sources, module_file)
     
     # Extract Python function implementations
-    python_functions = re.findall(r'PyObject\*\s+(\w+)\s*\([^)]*\)\s*{', module_content)
+    python_functions = {m.group(1).decode('ascii') for m in _PY_IMPL_RE.finditer(module_content)}
     
-    missing_declarations = []
-    for func in python_functions:
-        if func not in declared_python_functions and func != 'PyInit_cor':
-            missing_declarations.append(func)
+    missing_declarations = sorted(python_functions - declared_python_functions - {'PyInit_cor'})
     
     if missing_declarations:
         print("⚠️  Missing Python function declarations:")
@@ -87,32 +256,39 @@ def test_function_declarations():
         print("✓ All Python functions properly declared")
         return True
 
-def test_include_consistency():
-    """Test include file consistency"""
-    print("\nTesting include consistency...")
-    
+def _check_includes(c_file, buf):
+    """Include issues for a single source file, checked on the raw bytes"""
     issues = []
-    c_files = list(Path('src').glob('*.c')) + list(Path('src').glob('*.cpp'))
     
-    for c_file in c_files:
-        with open(c_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+    # Check for required includes
+    if _OPENCV_RE.search(buf):
+        if b'#include <opencv2/opencv.hpp>' not in buf:
+            issues.append(f"{c_file}: Uses OpenCV but missing main include")
         
-        # Check for required includes
-        if 'opencv' in content.lower():
-            if '#include <opencv2/opencv.hpp>' not in content:
-                issues.append(f"{c_file}: Uses OpenCV but missing main include")
-            
-            if 'VideoCapture' in content and '#include <opencv2/videoio.hpp>' not in content:
-                issues.append(f"{c_file}: Uses VideoCapture but missing videoio include")
-            
-            if 'imshow' in content and '#include <opencv2/highgui.hpp>' not in content:
-                issues.append(f"{c_file}: Uses GUI functions but missing highgui include")
+        if b'VideoCapture' in buf and b'#include <opencv2/videoio.hpp>' not in buf:
+            issues.append(f"{c_file}: Uses VideoCapture but missing videoio include")
         
-        # Check for Python API usage
-        if 'PyObject' in content:
-            if '#include <Python.h>' not in content and '#include "cor.h"' not in content:
-                issues.append(f"{c_file}: Uses Python API but missing Python.h include")
+        if b'imshow' in buf and b'#include <opencv2/highgui.hpp>' not in buf:
+            issues.append(f"{c_file}: Uses GUI functions but missing highgui include")
+    
+    # Check for Python API usage
+    if b'PyObject' in buf:
+        if b'#include <Python.h>' not in buf and b'#include "cor.h"' not in buf:
+            issues.append(f"{c_file}: Uses Python API but missing Python.h include")
+    return issues
+
+def test_include_consistency(sources=None):
+    """Test include file consistency"""
+    print("\nTesting include consistency...")
+    
+    if sources is None:
+        sources = _load_sources()
+    c_files = [path for path in sources if path.suffix in ('.c', '.cpp')]
+    
+    # Only a few substring checks per file, threads are plenty
+    with ThreadPoolExecutor() as executor:
+        results = executor.map(_check_includes, c_files, [sources[path] for path in c_files])
+        issues = list(itertools.chain.from_iterable(results))
     
     if issues:
         print("⚠️  Include consistency issues:")
@@ -127,37 +303,17 @@ def test_configuration_completeness():
     """Test configuration file completeness"""
     print("\nTesting configuration completeness...")
     
-    config_files = {
-        'eye-detection-values.txt': [
-            'eye_cascade_scale_factor',
-            'pupil_detection_threshold',
-            'left_eye_offset_x',
-            'calibration_video_file'
-        ],
-        'gaze-direction-values.txt': [
-            'gaze_sensitivity_x',
-            'gaze_smoothing_factor',
-            'min_confidence_threshold',
-            'calibration_video_file'
-        ],
-        'cor.txt': [
-            'heatmap_color_scheme',
-            'frame_skip_factor',
-            'gaze_circle_radius',
-            'debug_mode'
-        ]
-    }
-    
     issues = []
-    for config_file, required_params in config_files.items():
-        if os.path.exists(config_file):
+    for config_file, required_params in _CONFIG_PARAMS.items():
+        if _exists(config_file):
             with open(config_file, 'r', encoding='utf-8') as f:
                 content = f.read()
             
-            missing_params = []
-            for param in required_params:
-                if param not in content:
-                    missing_params.append(param)
+            # One scan finds every parameter present; the rare misses are rechecked
+            # directly in case a parameter only occurs inside a longer match
+            found = set(_CONFIG_PARAM_RES[config_file].findall(content))
+            missing_params = [param for param in required_params
+                              if param not in found and param not in content]
             
             if missing_params:
                 issues.append(f"{config_file}: Missing parameters: {', '.join(missing_params)}")
@@ -173,35 +329,30 @@ def test_configuration_completeness():
         print("✓ Configuration files complete")
         return True
 
-def test_documentation_accuracy():
+def test_documentation_accuracy(sources=None):
     """Test documentation accuracy"""
     print("\nTesting documentation accuracy...")
     
+    if sources is None:
+        sources = _load_sources()
+    
     # Check if all documented functions exist in code
-    with open('Documentation.txt', 'r', encoding='utf-8') as f:
+    with open('Documentation.txt', 'rb') as f:
         doc_content = f.read()
     
     # Extract documented functions
-    documented_functions = re.findall(r'cor\.(\w+)\(', doc_content)
+    documented_functions = {m.group(1).decode('ascii') for m in _DOC_FUNC_RE.finditer(doc_content)}
     
     # Check against actual Python module functions
-    module_file = 'src/cor_module.cpp' if os.path.exists('src/cor_module.cpp') else 'src/cor_module.c'
-    with open(module_file, 'r', encoding='utf-8') as f:
-        module_content = f.read()
+    module_file = 'src/cor_module.cpp' if _exists('src/cor_module.cpp') else 'src/cor_module.c'
+    module_content = _source_bytes(sources, module_file)
     
     # Extract method definitions
-    method_pattern = r'{"(\w+)",\s*cor_\w+,'
-    actual_methods = re.findall(method_pattern, module_content)
+    actual_methods = {m.group(1).decode('ascii') for m in _METHOD_RE.finditer(module_content)}
     
-    missing_docs = []
-    for method in actual_methods:
-        if method not in documented_functions:
-            missing_docs.append(method)
-    
-    extra_docs = []
-    for func in documented_functions:
-        if func not in actual_methods:
-            extra_docs.append(func)
+    # Sorted so the report is stable; each name is listed once
+    missing_docs = sorted(actual_methods - documented_functions)
+    extra_docs = sorted(documented_functions - actual_methods)
     
     issues = []
     if missing_docs:
@@ -218,19 +369,21 @@ def test_documentation_accuracy():
         print("✓ Documentation accuracy looks good")
         return True
 
-def test_build_system():
+def test_build_system(sources=None):
     """Test build system configuration"""
     print("\nTesting build system...")
     
     issues = []
     
     # Check setup.py
-    if os.path.exists('setup.py'):
+    if _exists('setup.py'):
         with open('setup.py', 'r', encoding='utf-8') as f:
             setup_content = f.read()
         
         # Check for all source files
-        src_files = [f.name for f in Path('src').glob('*.c')]
+        if sources is None:
+            sources = _load_sources()
+        src_files = [path.name for path in sources if path.suffix == '.c']
         for src_file in src_files:
             if src_file not in setup_content:
                 issues.append(f"setup.py: Missing source file {src_file}")
@@ -246,10 +399,11 @@ def test_build_system():
     # Check requirements files
     req_files = ['requirements.txt', 'requirements-dev.txt']
     for req_file in req_files:
-        if os.path.exists(req_file):
+        if _exists(req_file):
             with open(req_file, 'r', encoding='utf-8') as f:
-                lines = [line.strip() for line in f.readlines() if line.strip() and not line.startswith('#')]
-            if len(lines) == 0:
+                # Stops at the first requirement line instead of collecting them all
+                has_requirements = any(line.strip() and not line.startswith('#') for line in f)
+            if not has_requirements:
                 issues.append(f"{req_file}: Empty requirements file")
         else:
             issues.append(f"{req_file}: File not found")
@@ -263,20 +417,23 @@ def test_build_system():
         print("✓ Build system configuration looks good")
         return True
 
-def generate_test_report():
+def generate_test_report(sources=None):
     """Generate a comprehensive test report"""
     print("\n" + "="*60)
     print("COMPREHENSIVE TEST REPORT")
     print("="*60)
     
     # Count files and lines
-    total_files = len([f for f in Path('.').rglob('*') if f.is_file() and not f.name.startswith('.')])
+    total_files = len([f for f in Path('.').rglob('*')
+                       if f.is_file() and not f.name.startswith('.') and f.parts[0] != _CACHE_DIR.name])
     
-    c_files = list(Path('src').glob('*.c')) + list(Path('src').glob('*.cpp')) + list(Path('include').glob('*.h'))
-    c_lines = sum(len(open(f, 'r', encoding='utf-8').readlines()) for f in c_files)
+    if sources is None:
+        sources = _load_sources()
+    c_files = list(sources)
+    c_lines = sum(_count_lines(buf) for buf in sources.values())
     
     py_files = [f for f in Path('.').glob('*.py')]
-    py_lines = sum(len(open(f, 'r', encoding='utf-8').readlines()) for f in py_files)
+    py_lines = sum(_count_lines(f.read_bytes()) for f in py_files)
     
     print(f"Total files: {total_files}")
     print(f"C/C++ files: {len(c_files)} ({c_lines} lines)")
@@ -290,7 +447,7 @@ def generate_test_report():
         'eye-detection-values.txt', 'gaze-direction-values.txt', 'cor.txt'
     ]
     
-    missing_critical = [f for f in critical_files if not os.path.exists(f)]
+    missing_critical = [f for f in critical_files if not _exists(f)]
     if missing_critical:
         print(f"\n⚠️  Missing critical files: {', '.join(missing_critical)}")
     else:
@@ -301,13 +458,16 @@ def main():
     print("Cor Gaze Detection Library - Comprehensive Test")
     print("="*60)
     
+    # Source files are shared by several tests, so read them only once
+    sources = _load_sources()
+    
     tests = [
-        ("C Syntax", test_c_syntax),
-        ("Function Declarations", test_function_declarations),
-        ("Include Consistency", test_include_consistency),
+        ("C Syntax", lambda: test_c_syntax(sources)),
+        ("Function Declarations", lambda: test_function_declarations(sources)),
+        ("Include Consistency", lambda: test_include_consistency(sources)),
         ("Configuration Completeness", test_configuration_completeness),
-        ("Documentation Accuracy", test_documentation_accuracy),
-        ("Build System", test_build_system)
+        ("Documentation Accuracy", lambda: test_documentation_accuracy(sources)),
+        ("Build System", lambda: test_build_system(sources))
     ]
     
     passed_tests = 0
@@ -320,7 +480,7 @@ def main():
         except Exception as e:
             print(f"✗ {test_name} test failed with exception: {e}")
     
-    generate_test_report()
+    generate_test_report(sources)
     
     print("\n" + "="*60)
     print("COMPREHENSIVE TEST RESULTS")
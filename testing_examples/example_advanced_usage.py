@@ -27,9 +27,10 @@ def working_gaze_detection_example():
     print("\n=== WORKING GAZE DETECTION WORKFLOW ===")
     
     # Use test_video.mp4 if available, otherwise use a sample path
-    video_path = "test_video.mp4" if os.path.exists("test_video.mp4") else "sample_video.mp4"
+    has_test_video = os.path.exists("test_video.mp4")
+    video_path = "test_video.mp4" if has_test_video else "sample_video.mp4"
     
-    if os.path.exists(video_path):
+    if has_test_video or os.path.exists(video_path):
         print(f"\n3. Processing {video_path}:")
         
         try:
@@ -65,7 +66,7 @@ def working_gaze_detection_example():
                 
                 # Step 5: Create visualization video
                 print("Step 5: Creating visualization video...")
-                success_viz = cor.run(video_path, "--visualize")
+                success_viz = cor.run(video_path, visualize=True)
                 
                 if success_viz:
                     print("✅ Visualization complete!")
@@ -84,6 +85,7 @@ def python_enhanced_functions_example():
     print("\n=== ENHANCED PYTHON FUNCTIONS (v1.0.1) ===")
     
     print("\n4. New Python functions available in v1.0.1:")
+    has_test_video = os.path.exists("test_video.mp4")
     
     # Configuration management
     print("   Testing configuration management...")
@@ -99,7 +101,7 @@ def python_enhanced_functions_example():
         print("   Config set operation failed")
     
     # Frame extraction
-    if os.path.exists("test_video.mp4"):
+    if has_test_video:
         print("   Testing frame extraction...")
         frames = cor.extract_frames("test_video.mp4", 3, "sample_frames")
         print(f"   Extracted frames: {len(frames)} files")
@@ -111,7 +113,7 @@ def python_enhanced_functions_example():
             print("   Cleaned up extracted frames")
     
     # Benchmarking
-    if os.path.exists("test_video.mp4"):
+    if has_test_video:
         print("   Testing performance benchmarking...")
         benchmark_result = cor.benchmark("test_video.mp4", 20)
         if isinstance(benchmark_result, dict) and "processing_fps" in benchmark_result:
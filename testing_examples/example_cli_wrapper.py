@@ -189,7 +189,7 @@ This example file usage:
         print("Running gaze detection analysis...")
         if args.visualize:
             print("Visualization mode enabled - will create overlay video")
-            success = cor.run(args.video_file, "--visualize")
+            success = cor.run(args.video_file, visualize=True)
         else:
             success = cor.run(args.video_file)
         
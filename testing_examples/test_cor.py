@@ -7,7 +7,7 @@ This script validates the installation and basic functionality
 import sys
 import os
 import tempfile
-import numpy as np
+import functools
 
 def test_import():
     """Test if cor module can be imported"""
@@ -98,11 +98,18 @@ def test_basic_functionality():
         print(f"✗ Configuration functions failed: {e}")
         return False
 
+@functools.lru_cache(maxsize=1)
 def create_test_video():
-    """Create a simple test video for testing"""
+    """Create a simple test video for testing (once per run, shared by the video tests)"""
     try:
+        # Only the video tests need OpenCV and NumPy, so import them here
         import cv2
-        
+        import numpy as np
+    except ImportError as e:
+        print(f"⏭️  Skipping test video creation: {e}")
+        return None
+    
+    try:
         # Create a temporary video file
         temp_dir = tempfile.gettempdir()
         video_path = os.path.join(temp_dir, "test_video.mp4")
@@ -116,14 +123,21 @@ def create_test_video():
         fourcc = cv2.VideoWriter_fourcc(*'mp4v')
         out = cv2.VideoWriter(video_path, fourcc, fps, (width, height))
         
+        # Face and pupil paths for every frame, computed up front (int() truncation as before)
+        t = np.arange(fps * duration)
+        centers_x = (width/2 + 50 * np.sin(t * 0.1)).astype(int).tolist()
+        centers_y = (height/2 + 30 * np.cos(t * 0.1)).astype(int).tolist()
+        pupil_offsets_x = (5 * np.sin(t * 0.2)).astype(int).tolist()
+        pupil_offsets_y = (3 * np.cos(t * 0.2)).astype(int).tolist()
+        
+        # One frame buffer for the whole video; write() encodes it before returning
+        frame = np.zeros((height, width, 3), dtype=np.uint8)
+        
         # Generate frames with a moving circle (simulating eye movement)
-        for frame_num in range(fps * duration):
-            # Create black frame
-            frame = np.zeros((height, width, 3), dtype=np.uint8)
-            
-            # Add moving circle (simulating face/eye)
-            center_x = int(width/2 + 50 * np.sin(frame_num * 0.1))
-            center_y = int(height/2 + 30 * np.cos(frame_num * 0.1))
+        for center_x, center_y, pupil_offset_x, pupil_offset_y in zip(
+                centers_x, centers_y, pupil_offsets_x, pupil_offsets_y):
+            # Reset to a black frame
+            frame[:] = 0
             
             # Draw face circle
             cv2.circle(frame, (center_x, center_y), 80, (100, 100, 100), -1)
@@ -135,8 +149,6 @@ def create_test_video():
             cv2.circle(frame, eye_right, 15, (255, 255, 255), -1)
             
             # Draw pupils
-            pupil_offset_x = int(5 * np.sin(frame_num * 0.2))
-            pupil_offset_y = int(3 * np.cos(frame_num * 0.2))
             cv2.circle(frame, (eye_left[0] + pupil_offset_x, eye_left[1] + pupil_offset_y), 5, (0, 0, 0), -1)
             cv2.circle(frame, (eye_right[0] + pupil_offset_x, eye_right[1] + pupil_offset_y), 5, (0, 0, 0), -1)
             
@@ -158,6 +170,7 @@ def test_video_validation():
         # Create test video
         video_path = create_test_video()
         if video_path is None:
+            print("⏭️  No test video available")
             return False
         
         # Test validation
@@ -182,6 +195,7 @@ def test_frame_extraction():
         # Create test video
         video_path = create_test_video()
         if video_path is None:
+            print("⏭️  No test video available")
             return False
         
         # Test frame extraction
@@ -206,6 +220,7 @@ def test_benchmark():
         # Create test video
         video_path = create_test_video()
         if video_path is None:
+            print("⏭️  No test video available")
             return False
         
         # Test benchmark
@@ -227,24 +242,35 @@ def main():
     print("Cor Gaze Detection Library - Test Suite")
     print("=" * 50)
     
-    tests = [
+    # Cheap tests first; the video tests encode a clip and are pointless if these fail
+    basic_tests = [
         ("Import Test", test_import),
         ("Help Function", test_help),
         ("Version Function", test_version),
-        ("Configuration Functions", test_config),
+        ("Basic Functionality", test_basic_functionality),
+    ]
+    video_tests = [
         ("Video Validation", test_video_validation),
         ("Frame Extraction", test_frame_extraction),
         ("Benchmark Function", test_benchmark),
     ]
     
     passed = 0
-    total = len(tests)
+    total = len(basic_tests) + len(video_tests)
     
-    for test_name, test_func in tests:
+    for test_name, test_func in basic_tests:
         print(f"\nRunning {test_name}...")
         if test_func():
             passed += 1
     
+    if passed == len(basic_tests):
+        for test_name, test_func in video_tests:
+            print(f"\nRunning {test_name}...")
+            if test_func():
+                passed += 1
+    else:
+        print(f"\n⏭️  Skipping {len(video_tests)} video tests: basic tests failed")
+    
     print("\n" + "=" * 50)
     print(f"Test Results: {passed}/{total} tests passed")
     
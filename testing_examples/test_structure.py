@@ -6,8 +6,27 @@ Tests the project structure and documentation without requiring compilation
 
 import os
 import sys
+import functools
 from pathlib import Path
 
+from _project_files import file_present, find_needles, list_dir
+
+@functools.lru_cache(maxsize=None)
+def _read(file_path):
+    """Read a text file once per run (text mode, unlike the shared read_bytes)"""
+    return Path(file_path).read_text(encoding="utf-8")
+
+def _count_lines(file_path):
+    """Count lines by scanning raw bytes in 1 MiB chunks"""
+    lines = 0
+    last = b"\n"
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            lines += chunk.count(b"\n")
+            last = chunk[-1:]
+    # A final line without a trailing newline still counts
+    return lines + (last != b"\n")
+
 def test_file_structure():
     """Test if all required files are present"""
     print("Testing project file structure...")
@@ -50,7 +69,7 @@ def test_file_structure():
     present_files = []
     
     for file_path in required_files:
-        if os.path.exists(file_path):
+        if file_present(file_path):
             present_files.append(file_path)
             print(f"✓ {file_path}")
         else:
@@ -72,9 +91,8 @@ def test_documentation_completeness():
     print("\nTesting documentation completeness...")
     
     # Check README.md
-    if os.path.exists("README.md"):
-        with open("README.md", "r", encoding="utf-8") as f:
-            readme_content = f.read()
+    if file_present("README.md"):
+        readme_content = _read("README.md")
         
         required_sections = [
             "# Cor - Advanced Gaze Detection Library",
@@ -85,20 +103,19 @@ def test_documentation_completeness():
             "## Examples"
         ]
         
-        readme_score = 0
+        found_sections = find_needles(required_sections, readme_content)
         for section in required_sections:
-            if section in readme_content:
+            if section in found_sections:
                 print(f"✓ README contains: {section}")
-                readme_score += 1
             else:
                 print(f"✗ README missing: {section}")
+        readme_score = len(found_sections)
         
         print(f"README completeness: {readme_score}/{len(required_sections)}")
     
     # Check Documentation.txt
-    if os.path.exists("Documentation.txt"):
-        with open("Documentation.txt", "r", encoding="utf-8") as f:
-            doc_content = f.read()
+    if file_present("Documentation.txt"):
+        doc_content = _read("Documentation.txt")
         
         required_functions = [
             "cor.help()",
@@ -110,13 +127,13 @@ def test_documentation_completeness():
             "cor.generate_advanced_heatmap("
         ]
         
-        doc_score = 0
+        found_functions = find_needles(required_functions, doc_content)
         for func in required_functions:
-            if func in doc_content:
+            if func in found_functions:
                 print(f"✓ Documentation contains: {func}")
-                doc_score += 1
             else:
                 print(f"✗ Documentation missing: {func}")
+        doc_score = len(found_functions)
         
         print(f"Documentation completeness: {doc_score}/{len(required_functions)}")
     
@@ -133,14 +150,9 @@ def test_configuration_files():
     }
     
     for config_file, expected_params in config_files.items():
-        if os.path.exists(config_file):
-            with open(config_file, "r", encoding="utf-8") as f:
-                content = f.read()
-            
-            param_count = 0
-            for param in expected_params:
-                if param in content:
-                    param_count += 1
+        if file_present(config_file):
+            content = _read(config_file)
+            param_count = sum(1 for param in expected_params if param in content)
             
             print(f"✓ {config_file}: {param_count}/{len(expected_params)} key parameters found")
         else:
@@ -151,9 +163,8 @@ def test_source_code_structure():
     print("\nTesting source code structure...")
     
     # Check header file
-    if os.path.exists("include/cor.h"):
-        with open("include/cor.h", "r", encoding="utf-8") as f:
-            header_content = f.read()
+    if file_present("include/cor.h"):
+        header_content = _read("include/cor.h")
         
         required_declarations = [
             "PyObject* cor_help",
@@ -164,10 +175,7 @@ def test_source_code_structure():
             "GazePoint"
         ]
         
-        header_score = 0
-        for declaration in required_declarations:
-            if declaration in header_content:
-                header_score += 1
+        header_score = sum(1 for declaration in required_declarations if declaration in header_content)
         
         print(f"✓ Header file completeness: {header_score}/{len(required_declarations)}")
     
@@ -182,9 +190,11 @@ def test_source_code_structure():
         "src/advanced_features.cpp"
     ]
     
+    src_entries = list_dir("src")
     for src_file in source_files:
-        if os.path.exists(src_file):
-            file_size = os.path.getsize(src_file)
+        entry = src_entries.get(os.path.basename(src_file))
+        if entry is not None:
+            file_size = entry.stat().st_size
             print(f"✓ {src_file}: {file_size} bytes")
         else:
             print(f"✗ {src_file}: Missing")
@@ -194,9 +204,8 @@ def test_build_system():
     print("\nTesting build system...")
     
     # Check setup.py
-    if os.path.exists("setup.py"):
-        with open("setup.py", "r", encoding="utf-8") as f:
-            setup_content = f.read()
+    if file_present("setup.py"):
+        setup_content = _read("setup.py")
         
         required_setup_elements = [
             "from setuptools import setup",
@@ -206,19 +215,15 @@ def test_build_system():
             "install_requires="
         ]
         
-        setup_score = 0
-        for element in required_setup_elements:
-            if element in setup_content:
-                setup_score += 1
+        setup_score = sum(1 for element in required_setup_elements if element in setup_content)
         
         print(f"✓ setup.py completeness: {setup_score}/{len(required_setup_elements)}")
     
     # Check requirements files
     req_files = ["requirements.txt", "requirements-dev.txt"]
     for req_file in req_files:
-        if os.path.exists(req_file):
-            with open(req_file, "r", encoding="utf-8") as f:
-                lines = [line.strip() for line in f.readlines() if line.strip() and not line.startswith("#")]
+        if file_present(req_file):
+            lines = [line.strip() for line in _read(req_file).splitlines() if line.strip() and not line.startswith("#")]
             print(f"✓ {req_file}: {len(lines)} dependencies")
         else:
             print(f"✗ {req_file}: Missing")
@@ -233,14 +238,14 @@ def generate_project_summary():
     categories = {
         "Core Files": ["setup.py", "README.md", "Documentation.txt", "LICENSE"],
         "Configuration": ["eye-detection-values.txt", "gaze-direction-values.txt", "cor.txt"],
-        "Source Code": ["include/cor.h"] + [f"src/{f}" for f in os.listdir("src") if f.endswith((".c", ".cpp"))],
+        "Source Code": ["include/cor.h"] + [f"src/{f}" for f in list_dir("src") if f.endswith((".c", ".cpp"))],
         "Tests & Build": ["test_cor.py", "build_and_test.py", "validate_project.py", "Makefile"],
         "Examples": ["example_advanced_usage.py", "IMPROVEMENTS_SUMMARY.md"]
     }
     
     total_files = 0
     for category, files in categories.items():
-        existing_files = [f for f in files if os.path.exists(f)]
+        existing_files = [f for f in files if file_present(f)]
         total_files += len(existing_files)
         print(f"{category}: {len(existing_files)}/{len(files)} files")
     
@@ -248,26 +253,16 @@ def generate_project_summary():
     
     # Calculate total lines of code
     code_files = []
-    if os.path.exists("include"):
-        code_files.extend([f"include/{f}" for f in os.listdir("include") if f.endswith(".h")])
-    if os.path.exists("src"):
-        code_files.extend([f"src/{f}" for f in os.listdir("src") if f.endswith((".c", ".cpp"))])
+    code_files.extend([f"include/{f}" for f in list_dir("include") if f.endswith(".h")])
+    code_files.extend([f"src/{f}" for f in list_dir("src") if f.endswith((".c", ".cpp"))])
     
-    total_lines = 0
-    for code_file in code_files:
-        if os.path.exists(code_file):
-            with open(code_file, "r", encoding="utf-8") as f:
-                lines = len(f.readlines())
-                total_lines += lines
+    total_lines = sum(_count_lines(code_file) for code_file in code_files)
     
     print(f"Total lines of C code: {total_lines}")
     
     # Check Python files
-    python_files = [f for f in os.listdir(".") if f.endswith(".py")]
-    python_lines = 0
-    for py_file in python_files:
-        with open(py_file, "r", encoding="utf-8") as f:
-            python_lines += len(f.readlines())
+    python_files = [f for f in list_dir(".") if f.endswith(".py")]
+    python_lines = sum(_count_lines(py_file) for py_file in python_files)
     
     print(f"Total lines of Python code: {python_lines}")
     print(f"Total lines of code: {total_lines + python_lines}")
@@ -4,211 +4,252 @@ Project validation script for Cor Gaze Detection Library
 Checks for missing files, broken references, and potential issues
 """
 
-import os
+import io
 import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-def check_file_exists(filepath, description=""):
-    """Check if a file exists"""
-    if os.path.exists(filepath):
-        print(f"✓ {filepath} {description}")
+from _project_files import file_present, find_needles, list_dir, read_bytes
+
+# Files are read as bytes and every pattern below is a bytes pattern; only the
+# names that get printed are decoded
+
+# Import statements at the start of a line (not "import" inside strings or other words)
+_IMPORT_RE = re.compile(rb'^\s*import\s+(\w+)', re.MULTILINE)
+_FROM_RE = re.compile(rb'^\s*from\s+(\w+)\s+import', re.MULTILINE)
+
+# Function definitions (and control statements, filtered out later) in C sources
+_FUNC_RE = re.compile(rb'(\w+)\s*\([^)]*\)\s*{')
+
+# Config lines holding an '=' whose first non-blank character is not '#'
+_PARAM_RE = re.compile(rb'^[^\S\n]*(?=[^#\s])[^\n]*=', re.MULTILINE)
+
+# Files checked by main(), as (path, description) pairs
+_CORE_FILES = (
+    ('setup.py', '- Python package setup'),
+    ('README.md', '- Main documentation'),
+    ('Documentation.txt', '- Technical documentation'),
+    ('LICENSE', '- License file'),
+    ('requirements.txt', '- Runtime dependencies'),
+    ('requirements-dev.txt', '- Development dependencies'),
+    ('Makefile', '- Build automation'),
+)
+
+_CONFIG_FILES = (
+    ('eye-detection-values.txt', '- Eye detection parameters'),
+    ('gaze-direction-values.txt', '- Gaze direction parameters'),
+    ('cor.txt', '- General configuration'),
+)
+
+_SOURCE_FILES = (
+    ('include/cor.h', '- Main header file'),
+    ('src/cor_module.cpp', '- Python module interface'),
+    ('src/eye_detection.cpp', '- Eye detection implementation'),
+    ('src/gaze_detection.cpp', '- Gaze detection implementation'),
+    ('src/calibration.cpp', '- Calibration interface'),
+    ('src/heatmap.cpp', '- Heatmap generation'),
+    ('src/video_processing.cpp', '- Video processing'),
+)
+
+_TEST_FILES = (
+    ('test_cor.py', '- Test suite'),
+    ('build_and_test.py', '- Build automation'),
+    ('validate_project.py', '- This validation script'),
+)
+
+_FILE_GROUPS = (
+    ('core files', _CORE_FILES),
+    ('configuration files', _CONFIG_FILES),
+    ('source code', _SOURCE_FILES),
+    ('test and build files', _TEST_FILES),
+)
+
+def _files_with_suffix(directory, suffix):
+    """Paths (plain strings) of the files in a directory's cached listing with the given suffix"""
+    return [entry.path for name, entry in list_dir(directory).items()
+            if name.endswith(suffix) and entry.is_file()]
+
+def check_file_exists(filepath, description="", out=None):
+    """Check if a file exists (looked up in its directory's cached listing)"""
+    # Only regular files count
+    if file_present(filepath):
+        print(f"✓ {filepath} {description}", file=out)
         return True
     else:
-        print(f"✗ Missing: {filepath} {description}")
+        print(f"✗ Missing: {filepath} {description}", file=out)
         return False
 
-def check_c_includes():
+def check_c_includes(out=None):
     """Check C include statements and function references"""
-    print("\nChecking C code includes and references...")
+    print("\nChecking C code includes and references...", file=out)
+    
+    # Pure-Python checkouts have no src/ or include/ at all
+    if not list_dir('src') and not list_dir('include'):
+        print("✓ No C sources to check", file=out)
+        return
     
-    c_files = list(Path('src').glob('*.c')) + list(Path('src').glob('*.cpp')) + list(Path('include').glob('*.h'))
+    c_files = _files_with_suffix('src', '.c') + _files_with_suffix('src', '.cpp') + _files_with_suffix('include', '.h')
     issues = []
+    function_lines = []
     
     for c_file in c_files:
-        with open(c_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-            
+        content = read_bytes(c_file)
+        found = find_needles(['#include <opencv2/opencv.hpp>', '#include <opencv2/highgui.hpp>', 'highgui',
+                               '#include <opencv2/videoio.hpp>', 'VideoCapture'], content)
+        
         # Check for common include issues
-        if '#include <opencv2/opencv.hpp>' in content:
-            if '#include <opencv2/highgui.hpp>' not in content and 'highgui' in content:
+        if '#include <opencv2/opencv.hpp>' in found:
+            if '#include <opencv2/highgui.hpp>' not in found and 'highgui' in found:
                 issues.append(f"{c_file}: Missing highgui include")
-            if '#include <opencv2/videoio.hpp>' not in content and 'VideoCapture' in content:
+            if '#include <opencv2/videoio.hpp>' not in found and 'VideoCapture' in found:
                 issues.append(f"{c_file}: Missing videoio include")
         
         # Check for function declarations vs implementations
-        if c_file.suffix == '.c':
-            functions = re.findall(r'(\w+)\s*\([^)]*\)\s*{', content)
+        if c_file.endswith('.c'):
+            functions = [name.decode('ascii') for name in _FUNC_RE.findall(content)]
             for func in functions:
                 if func not in ['main', 'if', 'for', 'while', 'switch']:
-                    print(f"  Function found in {c_file}: {func}")
+                    function_lines.append(f"  Function found in {c_file}: {func}")
+    
+    # One write for all the function names rather than a print per function
+    if function_lines:
+        print("\n".join(function_lines), file=out)
     
     if issues:
         for issue in issues:
-            print(f"⚠️  {issue}")
+            print(f"⚠️  {issue}", file=out)
     else:
-        print("✓ C code includes look good")
+        print("✓ C code includes look good", file=out)
 
-def check_python_imports():
+def check_python_imports(out=None):
     """Check Python import statements"""
-    print("\nChecking Python imports...")
+    print("\nChecking Python imports...", file=out)
     
     py_files = [f for f in Path('.').glob('*.py') if f.name != 'validate_project.py']
     
     for py_file in py_files:
         try:
-            with open(py_file, 'r') as f:
-                content = f.read()
+            content = read_bytes(str(py_file))
             
             # Look for import statements
-            imports = re.findall(r'import\s+(\w+)', content)
-            from_imports = re.findall(r'from\s+(\w+)\s+import', content)
-            
-            all_imports = imports + from_imports
+            all_imports = {match.group(1) for match in _IMPORT_RE.finditer(content)}
+            all_imports |= {match.group(1) for match in _FROM_RE.finditer(content)}
             if all_imports:
-                print(f"  {py_file}: {', '.join(set(all_imports))}")
+                names = sorted(name.decode('ascii') for name in all_imports)
+                print(f"  {py_file}: {', '.join(names)}", file=out)
                 
         except Exception as e:
-            print(f"⚠️  Could not read {py_file}: {e}")
+            print(f"⚠️  Could not read {py_file}: {e}", file=out)
 
-def check_config_references():
+def check_config_references(out=None):
     """Check configuration file references"""
-    print("\nChecking configuration file references...")
+    print("\nChecking configuration file references...", file=out)
     
     config_files = ['eye-detection-values.txt', 'gaze-direction-values.txt', 'cor.txt']
     
     for config_file in config_files:
-        if check_file_exists(config_file):
-            with open(config_file, 'r') as f:
-                lines = f.readlines()
-            
-            param_count = sum(1 for line in lines if '=' in line and not line.strip().startswith('#'))
-            print(f"  {config_file}: {param_count} parameters")
+        if check_file_exists(config_file, out=out):
+            # Config files are only read here, so they bypass the shared cache. A
+            # bare '\r' ends a line in text mode as well, so it becomes '\n' before
+            # the single regex sweep over the file
+            content = Path(config_file).read_bytes().replace(b'\r', b'\n')
+            param_count = sum(1 for _ in _PARAM_RE.finditer(content))
+            print(f"  {config_file}: {param_count} parameters", file=out)
 
-def check_documentation_consistency():
+def check_documentation_consistency(out=None):
     """Check documentation consistency"""
-    print("\nChecking documentation consistency...")
+    print("\nChecking documentation consistency...", file=out)
     
     doc_files = ['README.md', 'Documentation.txt']
     
     for doc_file in doc_files:
-        if check_file_exists(doc_file):
-            with open(doc_file, 'r') as f:
-                content = f.read()
+        if check_file_exists(doc_file, out=out):
+            content = read_bytes(doc_file)
             
             # Check for function mentions
             functions = ['cor.help', 'cor.calibrate_eyes', 'cor.calibrate_gaze', 'cor.run']
+            found = find_needles(functions, content)
             for func in functions:
-                if func in content:
-                    print(f"  {doc_file}: ✓ {func} documented")
+                if func in found:
+                    print(f"  {doc_file}: ✓ {func} documented", file=out)
                 else:
-                    print(f"  {doc_file}: ⚠️  {func} not found")
+                    print(f"  {doc_file}: ⚠️  {func} not found", file=out)
 
-def check_setup_py():
+def check_setup_py(out=None):
     """Check setup.py configuration"""
-    print("\nChecking setup.py...")
+    print("\nChecking setup.py...", file=out)
     
-    if check_file_exists('setup.py'):
-        with open('setup.py', 'r') as f:
-            content = f.read()
+    if check_file_exists('setup.py', out=out):
+        content = read_bytes('setup.py')
         
         # Check for required sections
         required_sections = ['name=', 'version=', 'ext_modules=', 'install_requires=']
+        found = find_needles(required_sections, content)
         for section in required_sections:
-            if section in content:
-                print(f"  ✓ {section} found")
+            if section in found:
+                print(f"  ✓ {section} found", file=out)
             else:
-                print(f"  ⚠️  {section} missing")
+                print(f"  ⚠️  {section} missing", file=out)
+
+def _run_buffered(check):
+    """Run a check with its output buffered, returning what it printed"""
+    out = io.StringIO()
+    check(out)
+    return out.getvalue()
 
 def main():
     """Run all validation checks"""
     print("Cor Gaze Detection Library - Project Validation")
     print("=" * 60)
     
-    # Check core files
-    print("\nChecking core files...")
-    core_files = [
-        ('setup.py', '- Python package setup'),
-        ('README.md', '- Main documentation'),
-        ('Documentation.txt', '- Technical documentation'),
-        ('LICENSE', '- License file'),
-        ('requirements.txt', '- Runtime dependencies'),
-        ('requirements-dev.txt', '- Development dependencies'),
-        ('Makefile', '- Build automation'),
-    ]
-    
-    missing_core = 0
-    for filepath, desc in core_files:
-        if not check_file_exists(filepath, desc):
-            missing_core += 1
-    
-    # Check configuration files
-    print("\nChecking configuration files...")
-    config_files = [
-        ('eye-detection-values.txt', '- Eye detection parameters'),
-        ('gaze-direction-values.txt', '- Gaze direction parameters'),
-        ('cor.txt', '- General configuration'),
-    ]
-    
-    missing_config = 0
-    for filepath, desc in config_files:
-        if not check_file_exists(filepath, desc):
-            missing_config += 1
-    
-    # Check source code
-    print("\nChecking source code...")
-    src_files = [
-        ('include/cor.h', '- Main header file'),
-        ('src/cor_module.cpp', '- Python module interface'),
-        ('src/eye_detection.cpp', '- Eye detection implementation'),
-        ('src/gaze_detection.cpp', '- Gaze detection implementation'),
-        ('src/calibration.cpp', '- Calibration interface'),
-        ('src/heatmap.cpp', '- Heatmap generation'),
-        ('src/video_processing.cpp', '- Video processing'),
+    # Check core, configuration, source and test/build files in one pass; every
+    # lookup is answered from the cached listings of '.', 'src' and 'include'
+    total_missing = 0
+    for heading, files in _FILE_GROUPS:
+        print(f"\nChecking {heading}...")
+        for filepath, desc in files:
+            if not check_file_exists(filepath, desc):
+                total_missing += 1
+    
+    # Run additional checks; they are independent, so run them side by side
+    # and print each one's buffered output in the usual order
+    checks = [
+        check_c_includes,
+        check_python_imports,
+        check_config_references,
+        check_documentation_consistency,
+        check_setup_py,
     ]
-    
-    missing_src = 0
-    for filepath, desc in src_files:
-        if not check_file_exists(filepath, desc):
-            missing_src += 1
-    
-    # Check test and build files
-    print("\nChecking test and build files...")
-    test_files = [
-        ('test_cor.py', '- Test suite'),
-        ('build_and_test.py', '- Build automation'),
-        ('validate_project.py', '- This validation script'),
-    ]
-    
-    missing_test = 0
-    for filepath, desc in test_files:
-        if not check_file_exists(filepath, desc):
-            missing_test += 1
-    
-    # Run additional checks
-    check_c_includes()
-    check_python_imports()
-    check_config_references()
-    check_documentation_consistency()
-    check_setup_py()
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        futures = [executor.submit(_run_buffered, check) for check in checks]
+        for future in futures:
+            sys.stdout.write(future.result())
     
     # Summary
-    total_missing = missing_core + missing_config + missing_src + missing_test
-    
-    print("\n" + "=" * 60)
-    print("VALIDATION SUMMARY")
-    print("=" * 60)
+    summary = [
+        "\n" + "=" * 60,
+        "VALIDATION SUMMARY",
+        "=" * 60,
+    ]
     
     if total_missing == 0:
-        print("🎉 All files present and project structure looks good!")
-        print("\nNext steps:")
-        print("1. Run: python build_and_test.py")
-        print("2. Or run: make auto")
-        print("3. Check build output for any compilation issues")
-        return 0
+        summary += [
+            "🎉 All files present and project structure looks good!",
+            "\nNext steps:",
+            "1. Run: python build_and_test.py",
+            "2. Or run: make auto",
+            "3. Check build output for any compilation issues",
+        ]
     else:
-        print(f"⚠️  {total_missing} files missing or issues found")
-        print("\nPlease address the missing files before building.")
-        return 1
+        summary += [
+            f"⚠️  {total_missing} files missing or issues found",
+            "\nPlease address the missing files before building.",
+        ]
+    
+    # Emit the whole summary in one write
+    sys.stdout.write("\n".join(summary) + "\n")
+    return 0 if total_missing == 0 else 1
 
 if __name__ == "__main__":
     exit(main())
\ No newline at end of file